@@ -0,0 +1,46 @@
+"""Schemas for the entities tracked in the open tools portal.
+
+Each entity type is described by a JSON schema compiled with
+fastjsonschema; submissions are validated as plain dicts and written
+back out unchanged, with no intermediate model object.
+"""
+
+import fastjsonschema
+
+_STRING = {"type": ["string", "null"]}
+_STRING_LIST = {"type": ["array", "null"], "items": {"type": "string"}}
+
+
+def _entity_schema(properties: dict) -> dict:
+    """Build the schema for one entity type keyed by unique_name."""
+    return {
+        "type": "object",
+        "properties": {"unique_name": {"type": "string"}, **properties},
+        "required": ["unique_name"],
+        "additionalProperties": False,
+    }
+
+
+LICENSE_SCHEMA = _entity_schema({"name": _STRING, "spdx_id": _STRING, "url": _STRING})
+ORGANIZATION_SCHEMA = _entity_schema({"name": _STRING, "description": _STRING, "url": _STRING})
+LANGUAGE_SCHEMA = _entity_schema({"name": _STRING, "description": _STRING, "url": _STRING})
+CATEGORY_SCHEMA = _entity_schema({"name": _STRING, "description": _STRING})
+SOFTWARE_SCHEMA = _entity_schema(
+    {
+        "name": _STRING,
+        "description": _STRING,
+        "url_website": _STRING,
+        "url_sourcecode": _STRING,
+        "url_docs": _STRING,
+        "languages": _STRING_LIST,
+        "organizations": _STRING_LIST,
+        "licenses": _STRING_LIST,
+        "categories": _STRING_LIST,
+    }
+)
+
+validate_license = fastjsonschema.compile(LICENSE_SCHEMA)
+validate_organization = fastjsonschema.compile(ORGANIZATION_SCHEMA)
+validate_language = fastjsonschema.compile(LANGUAGE_SCHEMA)
+validate_category = fastjsonschema.compile(CATEGORY_SCHEMA)
+validate_software = fastjsonschema.compile(SOFTWARE_SCHEMA)
@@ -0,0 +1,212 @@
+"""Process software tool submissions attached to GitHub issues.
+
+A submission issue carries a JSON file (attached to the issue body or a
+follow-up comment) describing new licenses, organizations, programming
+languages and software tools. This script downloads that file, writes one
+JSON file per new entity into the data repository and pushes the result
+to a new branch.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import os
+import re
+import shutil
+import string
+import subprocess
+from pathlib import Path
+
+import httpx
+import ijson
+import orjson
+import pygit2
+import urllib3
+
+from interface import validate_language, validate_license, validate_organization, validate_software
+
+TIMEOUT = 900
+WORKSPACE = Path(os.environ.get("GITHUB_WORKSPACE", "/github/workspace"))
+
+_JSON_URL_RE = re.compile(r"https?://[^\s)]+\.json\b")
+
+_POOL = urllib3.PoolManager()
+
+_NAME_TABLE = str.maketrans({" ": "-", **{c: c.lower() for c in string.ascii_uppercase}})
+
+
+def _github_headers() -> dict[str, str]:
+    """Return the request headers for the GitHub API."""
+    headers = {"Accept": "application/vnd.github+json"}
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+def get_json_file_urls_from_string(text: str) -> list[str]:
+    """Extract links to .json attachments from an issue or comment body."""
+    return _JSON_URL_RE.findall(text)
+
+
+async def _fetch_data_file(issue_url: str, comments_url: str, file_name: Path) -> Path:
+    """Fetch the issue and its comments concurrently and download the file."""
+    async with httpx.AsyncClient(
+        headers=_github_headers(), timeout=TIMEOUT, follow_redirects=True
+    ) as client:
+        comments_response, issue_response = await asyncio.gather(
+            client.get(comments_url), client.get(issue_url)
+        )
+        comments_response.raise_for_status()
+        issue_response.raise_for_status()
+        json_file_urls = []
+        for comment in comments_response.json():
+            if body := comment.get("body"):
+                json_file_urls += get_json_file_urls_from_string(body)
+        if not json_file_urls:
+            if body := issue_response.json().get("body"):
+                json_file_urls = get_json_file_urls_from_string(body)
+        if not json_file_urls:
+            raise RuntimeError("No JSON file found in the issue body or its comments.")
+    _download_file(json_file_urls[-1], file_name)
+    return file_name
+
+
+def _download_file(url: str, file_name: Path) -> None:
+    """Copy the file at url to disk without buffering it in Python."""
+    file_response = _POOL.request("GET", url, preload_content=False, timeout=TIMEOUT)
+    try:
+        if file_response.status != 200:
+            raise RuntimeError(f"Downloading {url} failed with status {file_response.status}.")
+        with open(file_name, "wb") as file_pointer:
+            shutil.copyfileobj(file_response, file_pointer, length=1024 * 1024)
+    finally:
+        file_response.release_conn()
+
+
+def download_data_file(issue_url: str, comments_url: str, file_name: Path) -> Path:
+    """Find the submitted JSON file for an issue and download it.
+
+    The comments and the issue body are requested in parallel; comment
+    attachments win so a corrected re-upload supersedes the original.
+    """
+    return asyncio.run(_fetch_data_file(issue_url, comments_url, file_name))
+
+
+@functools.lru_cache(maxsize=None)
+def _normalize(name: str) -> str:
+    """Turn a unique_name into its file name."""
+    return name.translate(_NAME_TABLE) + ".json"
+
+
+def _check_unique_name(ent: dict) -> str:
+    """Return the file name for an entity, derived from its unique_name."""
+    if "unique_name" not in ent:
+        raise KeyError(f"Entry {ent} is missing a unique_name.")
+    return _normalize(ent["unique_name"])
+
+
+def dump_new_file(obj: dict, json_file: Path) -> Path | None:
+    """Write the entity to json_file unless it already exists."""
+    try:
+        fd = os.open(str(json_file), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return None
+    try:
+        os.write(fd, orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    finally:
+        os.close(fd)
+    return json_file
+
+
+_SECTIONS = {
+    "licenses": (validate_license, "licenses"),
+    "organizations": (validate_organization, "organizations"),
+    "languages": (validate_language, "languages"),
+    "software": (validate_software, "software"),
+}
+
+
+def _dump_one(entity: dict, validate, dir_path: Path) -> Path | None:
+    """Derive the entity's file name and write its file if it is new."""
+    json_file = dir_path / _check_unique_name(entity)
+    # Known entities are the common case when an issue is re-processed;
+    # bail out before paying for validation. The exclusive create in
+    # dump_new_file remains as the race-free backstop.
+    if json_file.exists():
+        return None
+    validate(entity)
+    return dump_new_file(entity, json_file)
+
+
+def process_issue_json_file(issue_file: Path, data_path: Path) -> list[Path]:
+    """Create entity files for every new entry in the submitted JSON file.
+
+    The file is stream-parsed with ijson, one top-level section at a
+    time, so memory stays bounded to a single entity regardless of how
+    large the submission is. The per-entity writes are I/O-bound, so
+    they run on a thread pool and are collected at the end.
+    """
+    futures = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        for key, (validate, subdir) in _SECTIONS.items():
+            with open(issue_file, "rb") as file_pointer:
+                for entity in ijson.items(file_pointer, f"{key}.item"):
+                    futures.append(executor.submit(_dump_one, entity, validate, data_path / subdir))
+    new_files = []
+    for future in futures:
+        new_file = future.result()
+        if new_file:
+            new_files.append(new_file)
+    return new_files
+
+
+def setup_github_permissions() -> None:
+    """Configure git identity and workspace trust for the action container."""
+    Path.home().joinpath(".gitconfig").write_text(
+        "[user]\n"
+        "\temail = gpst.opentools@nrel.gov\n"
+        "\tname = GPST Opentools\n"
+        "[safe]\n"
+        "\tdirectory = /github/workspace\n",
+        encoding="utf-8",
+    )
+
+
+def main() -> None:
+    """Entry point for the issue-processing action."""
+    issue_number = os.environ["ISSUE_NUMBER"]
+    repository = os.environ["GITHUB_REPOSITORY"]
+    issue_url = f"https://api.github.com/repos/{repository}/issues/{issue_number}"
+    comments_url = f"{issue_url}/comments"
+
+    issue_file = download_data_file(issue_url, comments_url, WORKSPACE / "issue_data.json")
+    new_files = process_issue_json_file(issue_file, WORKSPACE / "data")
+    if not new_files:
+        print("No new entries found, nothing to commit.")
+        return
+
+    setup_github_permissions()
+    branch_name = f"submission-issue-{issue_number}"
+    repo = pygit2.Repository(str(WORKSPACE))
+    branch = repo.branches.local.create(branch_name, repo.head.peel())
+    repo.checkout(branch)
+    for new_file in new_files:
+        repo.index.add(str(new_file.relative_to(repo.workdir)))
+    repo.index.write()
+    signature = pygit2.Signature("GPST Opentools", "gpst.opentools@nrel.gov")
+    repo.create_commit(
+        "HEAD",
+        signature,
+        signature,
+        f"Add new entries from issue #{issue_number}",
+        repo.index.write_tree(),
+        [repo.head.target],
+    )
+    # Push still goes through the git CLI so the runner's credential
+    # helper is honored without re-implementing auth callbacks.
+    subprocess.run(["git", "push", "origin", branch_name], cwd=WORKSPACE, check=True)
+
+
+if __name__ == "__main__":
+    main()